@@ -7,21 +7,25 @@ Created on Sat Nov 16 11:07:54 2024
 ### Imports ###
 ###############
 # Standard library imports
+import atexit
+import functools
 import logging
-import math
 import os
 import platform
+import queue
 import random
 import sys
-import time
-from logging.handlers import RotatingFileHandler
+import threading
+from enum import IntEnum
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Third-party imports
 try:
+    import numpy as np
     import pygame
 except ImportError as e:
-    print(f"Required third-party module Pygame missing: {e}")  # Fallback to console output
+    print(f"Required third-party module missing: {e}")  # Fallback to console output
     sys.exit(1)  # Fail fast if critical modules are unavailable
 
 
@@ -31,16 +35,21 @@ except ImportError as e:
 # Constants
 LOG_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 LOG_BACKUP_COUNT = 5  # Number of rotated logs to keep
+LOG_BUFFER_CAPACITY = 1024  # Records buffered before writing to the log file
+LOG_DIR_ENV_VAR = "BINGO_LOG_DIR"  # Explicit log directory; skips the write test
+PLATFORM = platform.system()  # Looked up once; used for log paths and TTS voices
 
 # Global logger variable
 logger = None
+log_listener = None
 
+@functools.lru_cache(maxsize=1)
 def get_platform_log_dir():
     """
     Get the platform-specific default log directory.
     Returns a Path object.
     """
-    if platform.system() == "Darwin":  # macOS
+    if PLATFORM == "Darwin":  # macOS
         return Path.home() / "Documents" / "Bingo"
     else:  # Windows/Linux fallback
         return Path.home() / "Documents" / "Bingo"
@@ -65,7 +74,14 @@ def get_log_file_path():
     """
     Determine the log file path based on platform and write permissions.
     Creates directories if needed but does not test write access directly here.
+    A directory set in the BINGO_LOG_DIR environment variable is used as-is.
     """
+    env_log_dir = os.environ.get(LOG_DIR_ENV_VAR)
+    if env_log_dir:
+        log_dir = Path(env_log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        return log_dir / "bingo_log.txt"
+
     log_dir = get_platform_log_dir()
     log_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
 
@@ -79,29 +95,41 @@ def get_log_file_path():
 def configure_logging():
     """
     Configure logging with both file and stream handlers.
+    Records are queued by the caller and written by a background listener
+    thread; file writes are additionally buffered and flushed in batches.
     Fallback to console logging on failure.
     """
-    global logger  # Declare logger as global to make it accessible elsewhere
+    global logger, log_listener  # Declare as global to make them accessible elsewhere
 
     log_file = get_log_file_path()
     print(f"Log file path: {log_file}")  # Debugging help during startup
 
     try:
         # Create handlers
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
         stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=LOG_FILE_SIZE,
             backupCount=LOG_BACKUP_COUNT,
         )
-
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[stream_handler, file_handler],
+        file_handler.setFormatter(formatter)
+        buffered_file_handler = MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
         )
 
+        # Configure logging: callers only enqueue, the listener does the I/O
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(QueueHandler(log_queue))
+        log_listener = QueueListener(log_queue, stream_handler, buffered_file_handler)
+        log_listener.start()
+        atexit.register(log_listener.stop)  # Drain the queue before logging shuts down
+
         logger = logging.getLogger("BingoApp")
         logger.info("Logging is configured!")
     except Exception as e:
@@ -132,6 +160,10 @@ except ImportError as e:
 #########################
 pygame.init()
 
+# Only quit and key presses are handled; keep mouse motion and window events out of the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 
 ################
 ### Settings ###
@@ -153,10 +185,18 @@ PREVIOUS_CIRCLE_RADIUS = 70
 SINGLE_DIGIT_X_OFFSET = 20
 DROP_SHADOW_OFFSET = 2
 
+# Particle Settings
+PARTICLE_CAPACITY = 1024  # Maximum live particles per particle pool
+PARTICLE_FIELDS = ("x", "y", "vx", "vy", "lifetime", "radius")
+
 # Messaging and Timing
 ALL_BALLS_DRAWN_MSG = "All balls drawn! Reset to play again."
-REVIEW_DURATION = 3
-MESSAGE_TIMEOUT_DURATION = 5
+REVIEW_DURATION_MS = 3000
+MESSAGE_TIMEOUT_DURATION_MS = 5000
+
+# Frame pacing
+TARGET_FPS = 60
+_CLOCK = pygame.time.Clock()  # Shared by the game loop and animations
 
 # BINGO Setup
 BINGO_RANGES = {
@@ -166,6 +206,8 @@ BINGO_RANGES = {
     'G': range(46, 61),
     'O': range(61, 76),
 }
+# Ball label indexed by ball number (BINGO_RANGES covers 1-75 in order; index 0 is unused)
+BALL_LABEL_BY_NUMBER = (None,) + tuple(f"{letter}{num}" for letter, nums in BINGO_RANGES.items() for num in nums)
 BINGO_PATTERNS = {
     "REGULAR": "Regular",
     "T": "T",
@@ -176,6 +218,7 @@ BINGO_PATTERNS = {
     "BLACKOUT": "BLACKOUT",
 }
 CURRENT_BINGO_PATTERN = BINGO_PATTERNS["REGULAR"]
+PATTERN_KEYS = tuple(BINGO_PATTERNS.keys())  # Cycle order for the 'N' key
 
 # File Paths
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -191,6 +234,23 @@ pattern_filenames = {
 # Default confirm key is 'y' for 'yes'
 KEY_CONFIRM = pygame.K_y
 
+
+class Confirm(IntEnum):
+    """The Y/N prompt currently awaiting an answer, if any."""
+    NONE = 0
+    RESET = 1
+    RESTORE = 2
+    UNDO = 3
+
+
+# Prompt text indexed by Confirm value
+CONFIRM_MESSAGES = (
+    None,
+    "Reset the board? (Y/N)",
+    "Restore the last board? (Y/N)",
+    "Undo last ball? (Y/N)",
+)
+
 #BINGO Board constants
 BALLS_PER_COLUMN = 15
 CIRCLE_X_OFFSET = 40
@@ -219,8 +279,7 @@ def setup_tts(preferred_voice=None):
 
     # Determine the preferred voice based on platform
     if preferred_voice is None:
-        os_type = platform.system()
-        preferred_voice = "male" if os_type == "Windows" else "Alex"
+        preferred_voice = "male" if PLATFORM == "Windows" else "Alex"
 
     # Search for the preferred voice
     found_voice = False
@@ -240,16 +299,56 @@ def setup_tts(preferred_voice=None):
     return tts_engine
 
 
-# Initialize TTS engine
-try:
-    tts_engine = setup_tts()
-    if tts_engine:
-        logger.info("TTS engine initialized successfully.")
-    else:
+# Ball labels waiting to be spoken by the TTS worker
+tts_queue = queue.Queue()
+
+
+def tts_worker():
+    """
+    Owns the TTS engine and speaks queued ball labels in the background,
+    so announcements never stall the render loop.
+
+    The engine is created on this thread because SAPI5/NSSS engines must
+    be driven from the thread that initialized them.
+    """
+    try:
+        tts_engine = setup_tts()
+    except Exception as e:
+        logger.error(f"Unexpected error during TTS initialization: {e}")
+        tts_engine = None
+
+    if not tts_engine:
         logger.warning("TTS engine unavailable; text-to-speech features disabled.")
-except Exception as e:
-    logger.error(f"Unexpected error during TTS initialization: {e}")
-    tts_engine = None
+        return  # Thread exits; speak_ball stops queueing
+    logger.info("TTS engine initialized successfully.")
+
+    # Prewarm the engine so the first announcement doesn't pay the startup cost
+    try:
+        tts_engine.say(" ")
+        tts_engine.runAndWait()
+    except Exception as e:
+        logger.warning(f"Failed to prewarm TTS engine: {e}")
+
+    while True:
+        # Block for one label, then batch anything else already queued
+        ball_labels = [tts_queue.get()]
+        while True:
+            try:
+                ball_labels.append(tts_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            for ball_label in ball_labels:
+                tts_engine.say(ball_label)
+            tts_engine.runAndWait()
+        except Exception as e:
+            logger.error(f"Failed to speak {ball_labels}: {e}")
+
+
+# Initialize TTS engine on its own thread
+tts_thread = threading.Thread(target=tts_worker, name="TTSWorker", daemon=True)
+tts_thread.start()
 
 
 #############
@@ -280,12 +379,73 @@ REVIEW_FONT = load_font(200)
 PREVIOUS_FONT = load_font(80)
 NUMBER_FONT_SIZE = 100
 
+# Fonts for every size the review-to-board animation passes through
+ANIMATION_START_FONT_SIZE = 200
+ANIMATION_END_FONT_SIZE = NUMBER_FONT_SIZE - 25
+FONT_BY_SIZE = {
+    size: load_font(size)
+    for size in range(ANIMATION_END_FONT_SIZE, ANIMATION_START_FONT_SIZE + 1)
+}
+
+# Rendered text surfaces keyed on (id(font), text, color)
+_TEXT_CACHE = {}
+
+
+def cached_render(font, text, color):
+    """
+    Render text once and reuse the surface on subsequent calls.
+
+    Args:
+        font (pygame.font.Font): The font object to use for rendering.
+        text (str): The text to render.
+        color (tuple): The color of the text (R, G, B).
+
+    Returns:
+        pygame.Surface: The rendered (and cached) text surface.
+    """
+    key = (id(font), text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+    return surface
+
+
+# Pre-rendered filled circles keyed on (color, radius)
+_CIRCLE_CACHE = {}
+
+
+def cached_circle(color, radius):
+    """
+    Draw a filled circle once onto a transparent surface and reuse it.
+
+    Args:
+        color (tuple): The color of the circle (R, G, B).
+        radius (int): The radius of the circle.
+
+    Returns:
+        pygame.Surface: A (2 * radius) square surface holding the circle.
+    """
+    key = (color, radius)
+    surface = _CIRCLE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        surface = surface.convert_alpha()
+        _CIRCLE_CACHE[key] = surface
+    return surface
+
 
 ####################
 ### Screen Setup ###
 ####################
 try:
-    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+    try:
+        # Scaled fullscreen presents through the renderer, which allows vsync
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN | pygame.SCALED, vsync=1)
+    except pygame.error as e:
+        logger.warning(f"Scaled fullscreen with vsync unavailable ({e}); using plain fullscreen.")
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
     pygame.display.set_caption("Alvadore Community Chest BINGO")
     logger.info("Screen setup completed successfully.")
 except Exception as e:
@@ -299,23 +459,72 @@ except Exception as e:
 ####################################
 def initialize_balls():
     """
-    Initializes and shuffles the balls list for BINGO.
+    Initializes the pool of BINGO balls still to be drawn.
     
     Returns:
-        list: A shuffled list of BINGO balls.
+        set: Every BINGO ball label; draws pick from it at random.
     """
-    try:
-        balls = [
-            f"{letter}{num}"
-            for letter, nums in BINGO_RANGES.items()
-            for num in nums
-        ]
-        random.shuffle(balls)
-        logger.info("Initialized and shuffled balls.")
-        return balls
-    except Exception as e:
-        logger.error(f"Failed to initialize balls: {e}")
-        return []
+    logger.info("Initialized balls.")
+    return set(BALL_LABEL_BY_NUMBER[1:])
+
+
+def ball_bit(ball_label):
+    """Returns the drawn-mask bit for a ball label (bit n is ball number n)."""
+    return 1 << int(ball_label[1:])
+
+
+def record_drawn_ball(state, ball_label):
+    """
+    Marks a ball as drawn, keeping the draw order, the drawn-ball bitmask
+    and the remaining-ball set in sync.
+
+    Args:
+        state (GameState): The current game state.
+        ball_label (str): The drawn ball (e.g., "B10").
+
+    Returns:
+        None
+    """
+    state.drawn_balls.append(ball_label)
+    state.drawn_mask |= ball_bit(ball_label)
+    state.remaining_set.discard(ball_label)
+
+
+def undo_last_drawn_ball(state):
+    """
+    Removes the most recently drawn ball from the drawn balls and bitmask,
+    returning it to the remaining-ball set.
+
+    Args:
+        state (GameState): The current game state.
+
+    Returns:
+        str: The removed ball label.
+    """
+    last_ball = state.drawn_balls.pop()
+    state.drawn_mask &= ~ball_bit(last_ball)
+    state.remaining_set.add(last_ball)
+    return last_ball
+
+
+def set_drawn_balls(state, drawn_balls):
+    """
+    Replaces the drawn balls and rebuilds the drawn-ball bitmask and the
+    remaining-ball set.
+
+    Args:
+        state (GameState): The current game state.
+        drawn_balls (list): Ball labels in the order they were drawn.
+
+    Returns:
+        None
+    """
+    state.drawn_balls = list(drawn_balls)
+    drawn_mask = 0
+    for ball_label in drawn_balls:
+        drawn_mask |= ball_bit(ball_label)
+    state.drawn_mask = drawn_mask
+    state.remaining_set = initialize_balls().difference(drawn_balls)
 
 
 def reset_board(state):
@@ -323,18 +532,17 @@ def reset_board(state):
     Resets the board to its initial state, saving the current balls.
 
     Args:
-        state (dict): The current game state containing 'balls' and 'drawn_balls'.
+        state (GameState): The current game state; its drawn_balls, last_game and remaining_set are updated.
     
     Returns:
         None
     """
     try:
-        state["last_game"] = state["drawn_balls"].copy()
-        state["balls"] = initialize_balls()
-        state["drawn_balls"].clear()
+        state.last_game = state.drawn_balls.copy()
+        set_drawn_balls(state, [])
         logger.info("Board has been reset.")
-    except KeyError as e:
-        logger.error(f"State key missing during board reset: {e}")
+    except AttributeError as e:
+        logger.error(f"State attribute missing during board reset: {e}")
     except Exception as e:
         logger.error(f"Unexpected error during board reset: {e}")
 
@@ -344,19 +552,19 @@ def restore_last_game(state):
     Restores the last game state by reloading previously drawn balls.
 
     Args:
-        state (dict): The current game state containing 'last_game' and 'drawn_balls'.
+        state (GameState): The current game state; drawn_balls is reloaded from last_game.
     
     Returns:
         None
     """
     try:
-        if state.get("last_game"):  # Safely check if 'last_game' exists and is not empty
-            state["drawn_balls"] = state["last_game"].copy()
+        if state.last_game:  # Nothing to restore until a board has been reset
+            set_drawn_balls(state, state.last_game)
             logger.info("Restored the previous game state.")
         else:
             logger.warning("No previous game state to restore.")
-    except KeyError as e:
-        logger.error(f"State key missing during game restore: {e}")
+    except AttributeError as e:
+        logger.error(f"State attribute missing during game restore: {e}")
     except Exception as e:
         logger.error(f"Unexpected error during game restore: {e}")
 
@@ -364,11 +572,11 @@ def restore_last_game(state):
 def speak_ball(ball_label, state=None, state_key=None):
     """Speak the ball label out loud, with optional flag-checking to ensure it's only spoken once per game state."""
     if state and state_key:
-        if state.get(state_key, False):
+        if getattr(state, state_key):
             return  # Skip if already spoken for this state
-        state[state_key] = True  # Set flag to indicate speech was made
-    tts_engine.say(ball_label)
-    tts_engine.runAndWait()
+        setattr(state, state_key, True)  # Set flag to indicate speech was made
+    if tts_thread.is_alive():
+        tts_queue.put(ball_label)  # Spoken by tts_worker; returns immediately
 
 
 ###################################
@@ -379,11 +587,36 @@ def clear_screen():
     screen.fill(BACKGROUND_COLOR)
 
 
+def blit_batch(surface, blit_sequence):
+    """
+    Blits a sequence of (source, position) pairs in a single call.
+
+    Uses Surface.fblits where available (pygame-ce) and falls back to
+    Surface.blits otherwise.
+
+    Args:
+        surface (pygame.Surface): The destination surface.
+        blit_sequence (list): A list of (source surface, position) tuples.
+
+    Returns:
+        None
+    """
+    if not blit_sequence:
+        return
+    if hasattr(surface, "fblits"):
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
+
 def draw_newest_ball(newest_ball):
     """Draws the newest ball in a large circle at the center of the screen."""
     main_x, main_y = WIDTH * 0.5, HEIGHT // 2
-    pygame.draw.circle(screen, FONT_COLOR, (main_x, main_y), REVIEW_CIRCLE_RADIUS)
-    main_text_surface = REVIEW_FONT.render(newest_ball, True, QUESTION_COLOR)
+    screen.blit(
+        cached_circle(FONT_COLOR, REVIEW_CIRCLE_RADIUS),
+        (main_x - REVIEW_CIRCLE_RADIUS, main_y - REVIEW_CIRCLE_RADIUS)
+    )
+    main_text_surface = cached_render(REVIEW_FONT, newest_ball, QUESTION_COLOR)
     main_text_rect = main_text_surface.get_rect(center=(main_x, main_y))
     screen.blit(main_text_surface, main_text_rect)
 
@@ -391,12 +624,19 @@ def draw_newest_ball(newest_ball):
 def draw_previous_balls(previous_balls):
     """Draws up to five previous balls in a vertical row on the left."""
     previous_balls_x = WIDTH // 7
+    circle_surface = cached_circle(FONT_COLOR, PREVIOUS_CIRCLE_RADIUS)
+    circles, texts = [], []
     for i, ball in enumerate(reversed(previous_balls)):
         y_offset = HEIGHT // 5 + i * 150
-        pygame.draw.circle(screen, FONT_COLOR, (previous_balls_x, y_offset), PREVIOUS_CIRCLE_RADIUS)
-        text_surface = PREVIOUS_FONT.render(ball, True, QUESTION_COLOR)
-        text_rect = text_surface.get_rect(center=(previous_balls_x, y_offset))
-        screen.blit(text_surface, text_rect)
+        circles.append((
+            circle_surface,
+            (previous_balls_x - PREVIOUS_CIRCLE_RADIUS, y_offset - PREVIOUS_CIRCLE_RADIUS)
+        ))
+        text_surface = cached_render(PREVIOUS_FONT, ball, QUESTION_COLOR)
+        texts.append((text_surface, text_surface.get_rect(center=(previous_balls_x, y_offset))))
+
+    blit_batch(screen, circles)
+    blit_batch(screen, texts)
 
 
 def draw_bingo_pattern(state):
@@ -412,8 +652,8 @@ def draw_bingo_pattern(state):
         pattern_label_x, pattern_label_y
     )
 
-    current_pattern = state["current_pattern"]
-    pattern_image = state["pattern_images"].get(current_pattern)
+    current_pattern = state.current_pattern
+    pattern_image = state.pattern_images.get(current_pattern)
 
     if pattern_image:
         image_rect = pattern_image.get_rect(center=(pattern_value_x + 200, pattern_value_y + 300))
@@ -425,7 +665,8 @@ def draw_bingo_pattern(state):
         )
 
 
-def render_text_with_shadow(text, font, color, shadow_color, x, y, shadow_offset=DROP_SHADOW_OFFSET):
+def render_text_with_shadow(text, font, color, shadow_color, x, y, shadow_offset=DROP_SHADOW_OFFSET,
+                            surface=None):
     """
     Renders text with a drop shadow effect.
 
@@ -437,58 +678,35 @@ def render_text_with_shadow(text, font, color, shadow_color, x, y, shadow_offset
         x (int): The x-coordinate of the text.
         y (int): The y-coordinate of the text.
         shadow_offset (int): The offset for the shadow position.
+        surface (pygame.Surface): The surface to draw on. Defaults to the screen.
 
     Returns:
         None
     """
+    if surface is None:
+        surface = screen
+
     try:
         # Render and position the shadow
-        shadow_surface = font.render(text, True, shadow_color)
+        shadow_surface = cached_render(font, text, shadow_color)
         shadow_rect = shadow_surface.get_rect(topleft=(x + shadow_offset, y + shadow_offset))
-        screen.blit(shadow_surface, shadow_rect)
+        surface.blit(shadow_surface, shadow_rect)
         
         # Render and position the main text
-        text_surface = font.render(text, True, color)
+        text_surface = cached_render(font, text, color)
         text_rect = text_surface.get_rect(topleft=(x, y))
-        screen.blit(text_surface, text_rect)
-        
-        # logger.info(f"Rendered text '{text}' with shadow at ({x}, {y}).")
+        surface.blit(text_surface, text_rect)
     except Exception as e:
         logger.error(f"Failed to render text '{text}': {e}")
 
 
-def calculate_animation_frame(
-    start_pos, end_pos, start_radius, end_radius, start_font_size, end_font_size, t
-):
-    """
-    Calculate the current position, radius, and font size based on the progress (t).
-    
-    Args:
-        start_pos (tuple): Starting position (x, y).
-        end_pos (tuple): Ending position (x, y).
-        start_radius (int): Starting circle radius.
-        end_radius (int): Ending circle radius.
-        start_font_size (int): Starting font size.
-        end_font_size (int): Ending font size.
-        t (float): Progress ratio (0.0 to 1.0).
-
-    Returns:
-        tuple: Current position, radius, and font size.
-    """
-    current_x = start_pos[0] + t * (end_pos[0] - start_pos[0])
-    current_y = start_pos[1] + t * (end_pos[1] - start_pos[1])
-    current_radius = int(start_radius + t * (end_radius - start_radius))
-    current_font_size = int(start_font_size + t * (end_font_size - start_font_size))
-    return (current_x, current_y, current_radius, current_font_size)
-
-
 def spawn_particles_for_frame(frame, particles, x, y, spawn_rate=3):
     """
     Spawns particles based on the current frame.
 
     Args:
         frame (int): Current animation frame.
-        particles (list): List of existing particles.
+        particles (dict): The particle pool to spawn into.
         x (float): X-coordinate for particle spawning.
         y (float): Y-coordinate for particle spawning.
         spawn_rate (int): Number of particles to spawn per frame.
@@ -497,8 +715,7 @@ def spawn_particles_for_frame(frame, particles, x, y, spawn_rate=3):
         None
     """
     if frame % 1 == 0:  # Adjust spawn frequency if needed
-        for _ in range(spawn_rate):
-            particles.append(spawn_particle(x, y, speed_range=(1, 5)))
+        spawn_particles(particles, x, y, spawn_rate, speed_range=(1, 5))
 
 
 def render_frame(particles, ball_label, font_size, x, y, radius):
@@ -506,7 +723,7 @@ def render_frame(particles, ball_label, font_size, x, y, radius):
     Render the current frame with particles, ball, and text.
 
     Args:
-        particles (list): List of particle objects.
+        particles (dict): The particle pool for the animation.
         ball_label (str): Label to display on the ball.
         font_size (int): Font size for the label.
         x (float): X-coordinate of the ball.
@@ -514,17 +731,25 @@ def render_frame(particles, ball_label, font_size, x, y, radius):
         radius (int): Radius of the ball.
 
     Returns:
-        None
+        list: The screen areas drawn this frame (pygame.Rect).
     """
     screen.fill(BACKGROUND_COLOR)
-    update_particles(particles, HIGHLIGHT_COLOR)  # Update and render particles
-    pygame.draw.circle(screen, FONT_COLOR, (int(x), int(y)), radius)
-
-    dynamic_font = pygame.font.Font(None, font_size)
+    particle_rect = update_particles(particles, HIGHLIGHT_COLOR)  # Update and render particles
+    # Drawn directly: the radius changes every frame, so a cached sprite would never be reused
+    ball_rect = pygame.draw.circle(screen, FONT_COLOR, (int(x), int(y)), radius)
+
+    dynamic_font = FONT_BY_SIZE.get(font_size)
+    if dynamic_font is None:
+        dynamic_font = FONT_BY_SIZE[font_size] = load_font(font_size)
+    # Not cached: each (label, size) pair is only seen once per animation
     text_surface = dynamic_font.render(ball_label, True, QUESTION_COLOR)
     text_rect = text_surface.get_rect(center=(int(x), int(y)))
     screen.blit(text_surface, text_rect)
-    pygame.display.flip()
+
+    dirty_rects = [ball_rect.union(text_rect)]
+    if particle_rect:
+        dirty_rects.append(particle_rect)
+    return dirty_rects
 
 
 def animate_ball_transition(
@@ -548,61 +773,97 @@ def animate_ball_transition(
     Returns:
         None
     """
-    clock = pygame.time.Clock()
-    total_frames = int(duration * 60)  # Assuming 60 FPS
-    current_frame = 0
-    particles = []  # Persist particles within the animation scope
-
-    while current_frame < total_frames:
-        t = current_frame / total_frames
-        current_x, current_y, current_radius, current_font_size = calculate_animation_frame(
-            start_pos, end_pos, start_radius, end_radius, start_font_size, end_font_size, t
-        )
-
+    total_frames = int(duration * TARGET_FPS)
+    particles = create_particles()  # Persist particles within the animation scope
+    previous_rects = None
+
+    # Interpolate position, radius and font size for every frame up front
+    progress = np.linspace(0, 1, total_frames)
+    xs = start_pos[0] + progress * (end_pos[0] - start_pos[0])
+    ys = start_pos[1] + progress * (end_pos[1] - start_pos[1])
+    radii = (start_radius + progress * (end_radius - start_radius)).astype(int)
+    font_sizes = (start_font_size + progress * (end_font_size - start_font_size)).astype(int)
+
+    for current_frame, (current_x, current_y, current_radius, current_font_size) in enumerate(
+        zip(xs.tolist(), ys.tolist(), radii.tolist(), font_sizes.tolist())
+    ):
         # Spawn particles for the current frame
         spawn_particles_for_frame(current_frame, particles, current_x, current_y)
 
         # Render the current frame
-        render_frame(particles, ball_label, current_font_size, current_x, current_y, current_radius)
+        dirty_rects = render_frame(
+            particles, ball_label, current_font_size, current_x, current_y, current_radius
+        )
 
-        clock.tick(60)
-        current_frame += 1
+        # Present the whole screen once, then only what moved since the last frame
+        if previous_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(previous_rects + dirty_rects)
+        previous_rects = dirty_rects
 
+        _CLOCK.tick(TARGET_FPS)
 
-def spawn_particle(x, y, distance_range=(25, 100), speed_range=(0.01, 0.2), 
-                   lifetime_range=(30, 120), radius_range=(2, 5)):
+
+def create_particles(capacity=PARTICLE_CAPACITY):
+    """
+    Creates an empty particle pool.
+
+    Particles are stored as parallel NumPy arrays (one per field in
+    PARTICLE_FIELDS); only the first 'count' entries are live.
+
+    Args:
+        capacity (int): Maximum number of live particles.
+
+    Returns:
+        dict: The particle pool.
+    """
+    particles = {field: np.empty(capacity) for field in PARTICLE_FIELDS}
+    particles["radius"] = np.empty(capacity, dtype=np.int32)
+    particles["count"] = 0
+    return particles
+
+
+def spawn_particles(particles, x, y, amount, distance_range=(25, 100), speed_range=(0.01, 0.2),
+                    lifetime_range=(30, 120), radius_range=(2, 5)):
     """
-    Spawns a new particle with properties for animation or effects.
+    Spawns a batch of particles with randomized properties for animation or effects.
 
     Args:
-        x (int): The x-coordinate of the particle's center.
-        y (int): The y-coordinate of the particle's center.
+        particles (dict): The particle pool to spawn into.
+        x (int): The x-coordinate of the particles' center.
+        y (int): The y-coordinate of the particles' center.
+        amount (int): Number of particles to spawn.
         distance_range (tuple): Range for the offset distance from (x, y).
-        speed_range (tuple): Range for the particle's velocity.
-        lifetime_range (tuple): Range for the particle's lifetime in frames.
-        radius_range (tuple): Range for the particle's size (radius).
+        speed_range (tuple): Range for the particles' velocity.
+        lifetime_range (tuple): Range for the particles' lifetime in frames.
+        radius_range (tuple): Range for the particles' size (radius), inclusive.
 
     Returns:
-        dict: A particle with randomized properties.
+        None
     """
     try:
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(*distance_range)
-        speed = random.uniform(*speed_range)
-        lifetime = random.uniform(*lifetime_range)
-        radius = random.randint(*radius_range)
-
-        return {
-            "x": x + distance * math.cos(angle),
-            "y": y + distance * math.sin(angle),
-            "vx": speed * math.cos(angle),
-            "vy": speed * math.sin(angle),
-            "lifetime": lifetime,
-            "radius": radius,
-        }
+        start = particles["count"]
+        amount = min(amount, len(particles["x"]) - start)  # Drop spawns once the pool is full
+        if amount <= 0:
+            return
+        end = start + amount
+
+        angle = np.random.uniform(0, 2 * np.pi, amount)
+        distance = np.random.uniform(*distance_range, amount)
+        speed = np.random.uniform(*speed_range, amount)
+        cos_angle = np.cos(angle)
+        sin_angle = np.sin(angle)
+
+        particles["x"][start:end] = x + distance * cos_angle
+        particles["y"][start:end] = y + distance * sin_angle
+        particles["vx"][start:end] = speed * cos_angle
+        particles["vy"][start:end] = speed * sin_angle
+        particles["lifetime"][start:end] = np.random.uniform(*lifetime_range, amount)
+        particles["radius"][start:end] = np.random.randint(radius_range[0], radius_range[1] + 1, amount)
+        particles["count"] = end
     except Exception as e:
-        logger.error(f"Failed to spawn particle at ({x}, {y}): {e}")
-        return None
+        logger.error(f"Failed to spawn particles at ({x}, {y}): {e}")
 
 
 def update_particles(particles, highlight_color):
@@ -610,30 +871,50 @@ def update_particles(particles, highlight_color):
     Updates and renders particles, removing expired ones.
 
     Parameters:
-        particles (list): List of particle dictionaries.
+        particles (dict): The particle pool.
         highlight_color (tuple): Color of the particles.
+
+    Returns:
+        pygame.Rect or None: Bounding box of the drawn particles, if any.
     """
-    for particle in particles[:]:
-        particle["x"] += particle["vx"]
-        particle["y"] += particle["vy"]
-        particle["lifetime"] -= 1
-        if particle["lifetime"] <= 0:
-            particles.remove(particle)
-        else:
-            pygame.draw.circle(
-                screen,
-                highlight_color,
-                (int(particle["x"]), int(particle["y"])),
-                particle["radius"],
-            )
+    count = particles["count"]
+    if not count:
+        return None
+
+    particles["x"][:count] += particles["vx"][:count]
+    particles["y"][:count] += particles["vy"][:count]
+    particles["lifetime"][:count] -= 1
+
+    # Compact the surviving particles to the front of the pool
+    alive = particles["lifetime"][:count] > 0
+    alive_count = int(np.count_nonzero(alive))
+    if alive_count < count:
+        for field in PARTICLE_FIELDS:
+            values = particles[field]
+            values[:alive_count] = values[:count][alive]
+    particles["count"] = alive_count
+
+    xs = particles["x"][:alive_count].astype(int).tolist()
+    ys = particles["y"][:alive_count].astype(int).tolist()
+    radii = particles["radius"][:alive_count].tolist()
+    blit_batch(screen, [
+        (cached_circle(highlight_color, radius), (x - radius, y - radius))
+        for x, y, radius in zip(xs, ys, radii)
+    ])
+
+    if not alive_count:
+        return None
+    max_radius = max(radii)
+    left, top = min(xs) - max_radius, min(ys) - max_radius
+    return pygame.Rect(left, top, max(xs) + max_radius - left, max(ys) + max_radius - top)
 
 
 def update_and_render_particles(particles, highlight_color):
-    """Updates and renders all particles."""
-    update_particles(particles, highlight_color)
+    """Updates and renders all particles, returning their bounding box."""
+    return update_particles(particles, highlight_color)
 
 
-def render_bingo_letters(font_color):
+def render_bingo_letters(font_color, surface):
     """Renders the Bingo column letters (B, I, N, G, O) with drop shadows."""
     left_margin = WIDTH // 25
     letter_y_offset = HEIGHT // 30
@@ -643,20 +924,20 @@ def render_bingo_letters(font_color):
         number_y = row_number * row_height + row_height // 2
         letter_y = number_y + letter_y_offset
 
-        letter_surface = NUMBER_FONT.render(letter, True, font_color)
+        letter_surface = cached_render(NUMBER_FONT, letter, font_color)
         letter_rect = letter_surface.get_rect(center=(left_margin, letter_y))
 
-        shadow_surface = NUMBER_FONT.render(letter, True, QUESTION_COLOR)
+        shadow_surface = cached_render(NUMBER_FONT, letter, QUESTION_COLOR)
         shadow_rect = shadow_surface.get_rect(
             center=(left_margin + DROP_SHADOW_OFFSET, letter_y + DROP_SHADOW_OFFSET)
         )
 
-        screen.blit(shadow_surface, shadow_rect)
-        screen.blit(letter_surface, letter_rect)
+        surface.blit(shadow_surface, shadow_rect)
+        surface.blit(letter_surface, letter_rect)
 
 
-def render_bingo_numbers(state, font_color, highlight_color, particles):
-    """Renders the Bingo numbers and highlights drawn balls."""
+def render_bingo_number_labels(font_color, surface):
+    """Renders all 75 Bingo numbers with drop shadows, without highlights."""
     left_margin = WIDTH // 25
     right_margin = WIDTH // 50
     available_width = WIDTH - left_margin - right_margin
@@ -664,42 +945,108 @@ def render_bingo_numbers(state, font_color, highlight_color, particles):
     row_height = HEIGHT // GRID_SIZE
     number_offset = left_margin + col_width
 
-    newest_ball = state["drawn_balls"][-1] if state["drawn_balls"] else None
-
     for row_number, (letter, nums) in enumerate(BINGO_RANGES.items()):
         number_y = row_number * row_height + row_height // 2
 
         for jdx, num in enumerate(nums):
             x = number_offset + col_width * jdx
-            ball_label = f"{letter}{num}"
-
-            if ball_label in state["drawn_balls"]:
-                if ball_label == newest_ball:
-                    for _ in range(3):
-                        particles.append(spawn_particle(x + 40, number_y + 30))
-                pygame.draw.circle(
-                    screen, highlight_color, (x + 40, number_y + 30), CIRCLE_RADIUS
-                )
-
             text_x_offset = SINGLE_DIGIT_X_OFFSET if num < 10 else 0
             render_text_with_shadow(
-                str(num), NUMBER_FONT, font_color, QUESTION_COLOR, x + text_x_offset, number_y
+                str(num), NUMBER_FONT, font_color, QUESTION_COLOR, x + text_x_offset, number_y,
+                surface=surface
+            )
+
+
+# Per-cell layout: label -> (circle_center, highlight_pos, shadow_surf, shadow_pos, text_surf, text_pos)
+CELL_LAYOUT = {}
+
+
+def build_cell_layout(font_color):
+    """
+    Precomputes the surfaces and positions needed to highlight each ball.
+
+    Args:
+        font_color (tuple): The color for the number text.
+
+    Returns:
+        None
+    """
+    for letter, nums in BINGO_RANGES.items():
+        for num in nums:
+            ball_label = f"{letter}{num}"
+            circle_x, circle_y = get_board_position(ball_label)
+            text_x = circle_x - CIRCLE_X_OFFSET + (SINGLE_DIGIT_X_OFFSET if num < 10 else 0)
+            text_y = circle_y - CIRCLE_Y_OFFSET
+
+            CELL_LAYOUT[ball_label] = (
+                (circle_x, circle_y),
+                (circle_x - CIRCLE_RADIUS, circle_y - CIRCLE_RADIUS),
+                cached_render(NUMBER_FONT, str(num), QUESTION_COLOR),
+                (text_x + DROP_SHADOW_OFFSET, text_y + DROP_SHADOW_OFFSET),
+                cached_render(NUMBER_FONT, str(num), font_color),
+                (text_x, text_y),
             )
 
 
-def render_bingo_pattern(state, font_color):
+def render_bingo_numbers(state, font_color, highlight_color, particles):
+    """Highlights the drawn balls on top of the pre-rendered board."""
+    if not state.drawn_balls:
+        return
+
+    circle_x, circle_y = CELL_LAYOUT[state.drawn_balls[-1]][0]
+    spawn_particles(particles, circle_x, circle_y, 3)
+
+    # Only the drawn cells are visited; the rest are already on the board background
+    highlight_surface = cached_circle(highlight_color, CIRCLE_RADIUS)
+    highlights, shadows, texts = [], [], []
+    for ball_label in state.drawn_balls:
+        _, highlight_pos, shadow_surf, shadow_pos, text_surf, text_pos = CELL_LAYOUT[ball_label]
+        highlights.append((highlight_surface, highlight_pos))
+        shadows.append((shadow_surf, shadow_pos))
+        texts.append((text_surf, text_pos))
+
+    # Circles first, then the numbers re-blitted on top of them
+    blit_batch(screen, highlights)
+    blit_batch(screen, shadows)
+    blit_batch(screen, texts)
+
+
+def render_bingo_pattern(state, font_color, surface):
     """Renders the current Bingo pattern at the bottom of the screen."""
-    pattern_message = f"Pattern: {BINGO_PATTERNS[state['current_pattern']]}"
-    message_surface = PREVIOUS_FONT.render(pattern_message, True, font_color)
+    pattern_message = f"Pattern: {BINGO_PATTERNS[state.current_pattern]}"
+    message_surface = cached_render(PREVIOUS_FONT, pattern_message, font_color)
     message_rect = message_surface.get_rect(center=(WIDTH // 2, HEIGHT - 50))
 
-    shadow_surface = PREVIOUS_FONT.render(pattern_message, True, QUESTION_COLOR)
+    shadow_surface = cached_render(PREVIOUS_FONT, pattern_message, QUESTION_COLOR)
     shadow_rect = shadow_surface.get_rect(
         center=(WIDTH // 2 + DROP_SHADOW_OFFSET, HEIGHT - 50 + DROP_SHADOW_OFFSET)
     )
 
-    screen.blit(shadow_surface, shadow_rect)
-    screen.blit(message_surface, message_rect)
+    surface.blit(shadow_surface, shadow_rect)
+    surface.blit(message_surface, message_rect)
+
+
+def build_board_background(state, font_color):
+    """
+    Pre-renders the static parts of the board (letters, all numbers and the
+    pattern label) into an off-screen surface stored in the state.
+
+    Args:
+        state (GameState): The current game state.
+        font_color (tuple): The color for the text.
+
+    Returns:
+        None
+    """
+    board_bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+    board_bg.fill(BACKGROUND_COLOR)
+    render_bingo_letters(font_color, board_bg)
+    render_bingo_number_labels(font_color, board_bg)
+    render_bingo_pattern(state, font_color, board_bg)
+
+    state.board_bg = board_bg
+    state.board_bg_pattern = state.current_pattern
+    logger.info(f"Board background rendered for pattern: {state.current_pattern}")
 
 
 ##############
@@ -710,14 +1057,17 @@ def display_ball_review(state):
     """
     Displays the newest ball large on the right and up to five previous balls stacked on the left.
     """
+    if state.review_presented:
+        return  # Nothing on the review screen changes while it is shown
+
     clear_screen()
 
     # Display the newest ball
-    newest_ball = state["drawn_balls"][-1]
+    newest_ball = state.drawn_balls[-1]
     draw_newest_ball(newest_ball)
 
     # Display up to five previous balls
-    previous_balls = state["drawn_balls"][-6:-1] if len(state["drawn_balls"]) > 1 else []
+    previous_balls = state.drawn_balls[-6:-1] if len(state.drawn_balls) > 1 else []
     draw_previous_balls(previous_balls)
 
     # Display the Bingo pattern
@@ -725,6 +1075,7 @@ def display_ball_review(state):
 
     # Update the display to show all drawn elements
     pygame.display.flip()
+    state.review_presented = True
 
     # Speak the newest ball
     speak_ball(newest_ball, state, "review_spoken")
@@ -737,30 +1088,30 @@ def display_bingo_board(state, font_color, highlight_color):
     adding particle effects for the newest ball.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
         font_color (tuple): The color for the text.
         highlight_color (tuple): The color for highlighted balls.
 
     Returns:
-        None
+        pygame.Rect or None: Bounding box of this frame's particles, if any.
     """
-    # Step 1: Clear the screen
-    clear_screen()
+    # Step 1: Draw the pre-rendered board, rebuilding it if the pattern changed
+    if state.board_bg_pattern != state.current_pattern:
+        build_board_background(state, font_color)
+    screen.blit(state.board_bg, (0, 0))
 
     # Step 2: Update particles
-    if "particles" not in state:
-        state["particles"] = []
-    update_and_render_particles(state["particles"], highlight_color)
+    particle_rect = update_and_render_particles(state.particles, highlight_color)
 
-    # Step 3: Render Bingo elements
-    render_bingo_letters(font_color)
-    render_bingo_numbers(state, font_color, highlight_color, state["particles"])
-    render_bingo_pattern(state, font_color)
+    # Step 3: Highlight drawn balls
+    render_bingo_numbers(state, font_color, highlight_color, state.particles)
 
     # Step 4: Render Confirmation Message (always redraw)
-    confirmation_message = state.get("confirmation_message", "")
+    confirmation_message = state.confirmation_message
     display_confirmation(confirmation_message)
 
+    return particle_rect
+
 
 # Confirmation and input functions
 def display_confirmation(message):
@@ -776,25 +1127,24 @@ def display_confirmation(message):
     if not message:
         return  # No message to display
 
-    shadow_surface = CONFIRMATION_FONT.render(message, True, QUESTION_COLOR)
+    shadow_surface = cached_render(CONFIRMATION_FONT, message, QUESTION_COLOR)
     shadow_rect = shadow_surface.get_rect(center=(WIDTH // 2 + DROP_SHADOW_OFFSET, HEIGHT * 0.25 + DROP_SHADOW_OFFSET))
     screen.blit(shadow_surface, shadow_rect)
     
-    text_surface = CONFIRMATION_FONT.render(message, True, FONT_COLOR)
+    text_surface = cached_render(CONFIRMATION_FONT, message, FONT_COLOR)
     text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT * 0.25))
     screen.blit(text_surface, text_rect)
 
 
-def handle_confirmation(state, key, action, flag_key):
+def handle_confirmation(state, key, action):
     """
     Handles a confirmation response by executing the given action
-    and clearing the associated state flag.
+    and clearing the pending prompt.
 
     Args:
-        state (dict): The game state.
+        state (GameState): The game state.
         key (int): The pressed key.
         action (callable): The function to call if the confirmation key is pressed.
-        flag_key (str): The state flag key to clear.
 
     Returns:
         None
@@ -804,17 +1154,35 @@ def handle_confirmation(state, key, action, flag_key):
             action(state)  # Perform the specified action
         except Exception as e:
             logging.error(f"Failed to execute action '{action.__name__}': {e}")
-    state[flag_key] = False  # Clear the confirmation flag
+    state.confirmation = Confirm.NONE  # Clear the prompt
 
 
 def handle_confirmation_input(state, key):
     """Handle the reset confirmation response."""
-    handle_confirmation(state, key, reset_board, "awaiting_confirmation")
+    handle_confirmation(state, key, reset_board)
 
 
 def handle_restore_input(state, key):
     """Handle the restore confirmation response."""
-    handle_confirmation(state, key, restore_last_game, "awaiting_restore_confirmation")
+    handle_confirmation(state, key, restore_last_game)
+
+
+def handle_undo_input(state, key):
+    """Handle the undo confirmation response."""
+    if key == KEY_CONFIRM:
+        last_ball = undo_last_drawn_ball(state)
+        logging.info(f"Undo confirmed: {last_ball}")
+    elif key == pygame.K_n:
+        logging.info("Undo canceled.")
+    state.confirmation = Confirm.NONE
+
+
+# Response handler for each pending prompt
+CONFIRM_HANDLERS = {
+    Confirm.RESET: handle_confirmation_input,
+    Confirm.RESTORE: handle_restore_input,
+    Confirm.UNDO: handle_undo_input,
+}
 
 
 def handle_auto_mode_input(state, event):
@@ -822,18 +1190,18 @@ def handle_auto_mode_input(state, event):
     Handle inputs specific to auto mode.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
         event (pygame.event.Event): The event being processed.
 
     Returns:
         None
     """
-    if not isinstance(state, dict) or not hasattr(event, "key"):
+    if not isinstance(state, GameState) or not hasattr(event, "key"):
         logging.error("Invalid input: state or event is malformed.")
         return
 
     try:
-        if event.key == pygame.K_SPACE and not state["is_announcing"]:
+        if event.key == pygame.K_SPACE and not state.is_announcing:
             draw_ball(state)
     except Exception as e:
         logging.error(f"Error while handling SPACE key: {e}")
@@ -845,18 +1213,18 @@ def draw_next_ball(state):
     Draw the next ball from the state.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
 
     Returns:
         str or None: The drawn ball, or None if no balls are left.
     """
-    if not state.get("balls"):
+    if not state.remaining_set:
         logging.warning("Attempted to draw a ball from an empty list.")
         return None
 
-    ball = state["balls"].pop(0)
-    state["drawn_balls"].append(ball)
-    state["current_ball"] = ball
+    ball = random.choice(tuple(state.remaining_set))
+    record_drawn_ball(state, ball)
+    state.current_ball = ball
     logging.info(f"Drew ball: {ball}")
     return ball
 
@@ -866,14 +1234,14 @@ def enter_review_mode(state, ball):
     Set the state to review mode for the drawn ball.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
         ball (str): The ball to set as the current one in review mode.
 
     Returns:
         None
     """
-    if not isinstance(state, dict):
-        logging.error("Invalid state: Expected a dictionary.")
+    if not isinstance(state, GameState):
+        logging.error("Invalid state: Expected a GameState.")
         return
 
     if not isinstance(ball, str):
@@ -881,10 +1249,11 @@ def enter_review_mode(state, ball):
         return
 
     try:
-        state["is_reviewing"] = True
-        state["review_start_time"] = time.time()
-        state["review_spoken"] = False
-        state["current_ball"] = ball
+        state.is_reviewing = True
+        state.review_start_time = pygame.time.get_ticks()
+        state.review_spoken = False
+        state.review_presented = False
+        state.current_ball = ball
     except Exception as e:
         logging.error(f"Error entering review mode: {e}")
 
@@ -894,20 +1263,20 @@ def handle_no_balls_left(state):
     Handle the case when no balls are left to draw.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
 
     Returns:
         None
     """
     try:
-        if not isinstance(state, dict) or "message_timeout" not in state:
-            logging.error("Invalid state: Missing required keys.")
+        if not isinstance(state, GameState):
+            logging.error("Invalid state: Expected a GameState.")
             return
 
-        if state["message_timeout"] <= time.time():
+        if state.message_timeout <= pygame.time.get_ticks():
             logging.warning("All balls have been drawn.")
             display_confirmation(ALL_BALLS_DRAWN_MSG)
-            state["message_timeout"] = time.time() + MESSAGE_TIMEOUT_DURATION
+            state.message_timeout = pygame.time.get_ticks() + MESSAGE_TIMEOUT_DURATION_MS
     except Exception as e:
         logging.error(f"Error handling no balls left: {e}")
 
@@ -917,14 +1286,14 @@ def draw_ball(state):
     Draws the next ball or handles cases where all balls are drawn.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
 
     Returns:
         None
     """
     try:
-        if not isinstance(state, dict):
-            logging.error("Invalid state: Expected a dictionary.")
+        if not isinstance(state, GameState):
+            logging.error("Invalid state: Expected a GameState.")
             return
 
         ball = draw_next_ball(state)
@@ -948,135 +1317,152 @@ def interpret_ball_number(ball_number):
     """
     try:
         ball_number = int(ball_number)
-        for letter, nums in BINGO_RANGES.items():
-            if ball_number in nums:
-                return f"{letter}{ball_number}"
-        logging.warning(f"Invalid ball number entered: {ball_number}")
-        return None  # Invalid Bingo number
     except ValueError:
         logging.warning(f"Non-integer input received: {ball_number}")
         return None
 
+    if 1 <= ball_number < len(BALL_LABEL_BY_NUMBER):
+        return BALL_LABEL_BY_NUMBER[ball_number]
+    logging.warning(f"Invalid ball number entered: {ball_number}")
+    return None  # Invalid Bingo number
+
 
 def process_typed_number(state):
     """Process the currently typed number when Enter is pressed."""
-    ball_number = state.get("typed_number", "")
-    logging.info(f"Enter key pressed. Typed number: {ball_number}")
+    typed_number = state.typed_number
+    state.typed_number = ""  # Clear input after processing
+    logging.info(f"Enter key pressed. Typed number: {typed_number}")
 
-    if ball_number:
-        try:
-            ball_number = int(ball_number)
-            ball_label = interpret_ball_number(ball_number)
-            logging.info(f"Interpreted ball label: {ball_label}")
-
-            if ball_label in state["drawn_balls"]:
-                logging.warning(f"Ball {ball_label} is already drawn. Ignoring input.")
-            elif ball_label in state["balls"]:
-                # Valid ball, process it
-                state["drawn_balls"].append(ball_label)
-                state["balls"].remove(ball_label)
-                state["current_ball"] = ball_label
-                state["announcement_time"] = time.time()
-                state["is_announcing"] = True
-                logging.info(f"Successfully drew ball: {ball_label}")
-            else:
-                logging.warning(f"Invalid ball number entered: {ball_number}")
-        except ValueError:
+    if not typed_number.isdecimal():  # Empty, or something int() cannot parse
+        if typed_number:
             logging.error("Non-numeric entry detected. Resetting input.")
+        return
 
-    state["typed_number"] = ""  # Clear input after processing
+    ball_number = int(typed_number)
+    ball_label = interpret_ball_number(ball_number)
+    logging.info(f"Interpreted ball label: {ball_label}")
+
+    if ball_label is None:
+        logging.warning(f"Invalid ball number entered: {ball_number}")
+    elif state.drawn_mask & (1 << ball_number):
+        logging.warning(f"Ball {ball_label} is already drawn. Ignoring input.")
+    elif ball_label in state.remaining_set:
+        # Valid ball, process it
+        record_drawn_ball(state, ball_label)
+        state.current_ball = ball_label
+        state.announcement_time = pygame.time.get_ticks()
+        state.is_announcing = True
+        logging.info(f"Successfully drew ball: {ball_label}")
+    else:
+        logging.warning(f"Invalid ball number entered: {ball_number}")
 
 
-def process_backspace(state):
-    """Handle backspace input to modify typed number."""
-    state["typed_number"] = state.get("typed_number", "")[:-1]
-    logging.info(f"Backspace pressed. Current typed number: {state['typed_number']}")
+def process_backspace(state, count=1):
+    """Handle backspace input to modify typed number, once per press in the run."""
+    state.typed_number = state.typed_number[:-count]
+    logging.info(f"Backspace pressed. Current typed number: {state.typed_number}")
 
 
 def handle_undo_request(state):
     """Prompt for undo confirmation if there are drawn balls."""
-    if state["drawn_balls"]:
-        state["awaiting_undo_confirmation"] = True
+    if state.drawn_balls:
+        state.confirmation = Confirm.UNDO
         logging.info("Undo confirmation requested.")
     else:
         logging.warning("No balls to undo.")
 
 
-def handle_manual_mode_input(state, event):
+def handle_manual_mode_input(state, event, count=1, digits=""):
     """Handles input in manual mode, delegating to smaller functions."""
     if event.type == pygame.KEYDOWN:
         if event.key == pygame.K_RETURN:
             process_typed_number(state)
         elif event.key == pygame.K_BACKSPACE:
-            process_backspace(state)
+            process_backspace(state, count)
         elif event.key == pygame.K_u:
             handle_undo_request(state)
-        elif event.unicode.isnumeric():
-            state["typed_number"] = state.get("typed_number", "") + event.unicode
-            logging.info(f"Number key pressed. Current typed number: {state['typed_number']}")
+        elif digits:
+            state.typed_number = state.typed_number + digits
+            logging.info(f"Number key pressed. Current typed number: {state.typed_number}")
 
 
 def process_global_inputs(state, event):
     """Process inputs that apply globally, like quitting or switching modes."""
     if event.key == pygame.K_ESCAPE:
-        state["running"] = False
+        state.running = False
         logging.info("Quit event received, exiting game.")
     elif event.key == pygame.K_m:
-        state["is_manual_mode"] = True
+        state.is_manual_mode = True
         logging.info("Switched to manual mode.")
     elif event.key == pygame.K_a:
-        state["is_manual_mode"] = False
+        state.is_manual_mode = False
         logging.info("Switched to auto mode.")
     elif event.key == pygame.K_r:
-        state["awaiting_confirmation"] = True
+        state.confirmation = Confirm.RESET
         logging.info("Reset confirmation requested.")
     elif event.key == pygame.K_o:
-        state["awaiting_restore_confirmation"] = True
+        state.confirmation = Confirm.RESTORE
         logging.info("Restore confirmation requested.")
 
 
 def process_confirmation_inputs(state, event):
     """Process inputs related to confirmation prompts."""
-    if state["awaiting_undo_confirmation"]:
-        if event.key == pygame.K_y:
-            last_ball = state["drawn_balls"].pop()
-            state["balls"].insert(0, last_ball)
-            logging.info(f"Undo confirmed: {last_ball}")
-        elif event.key == pygame.K_n:
-            logging.info("Undo canceled.")
-        state["awaiting_undo_confirmation"] = False
-        return True  # Indicate confirmation was handled
+    if state.confirmation == Confirm.NONE:
+        return False  # No confirmation state was active
 
-    elif state["awaiting_confirmation"]:
-        handle_confirmation_input(state, event.key)
-        return True  # Indicate confirmation was handled
-
-    elif state["awaiting_restore_confirmation"]:
-        handle_restore_input(state, event.key)
-        return True  # Indicate confirmation was handled
-
-    return False  # No confirmation state was active
+    CONFIRM_HANDLERS[state.confirmation](state, event.key)
+    return True  # Indicate confirmation was handled
 
 
 def process_pattern_change(state, event):
     """Process inputs related to pattern changes."""
     if event.key == pygame.K_n:
-        pattern_keys = list(BINGO_PATTERNS.keys())
-        current_index = pattern_keys.index(state["current_pattern"])
-        next_index = (current_index + 1) % len(pattern_keys)
-        state["current_pattern"] = pattern_keys[next_index]
-        state["pattern_change_time"] = time.time() + 2
-        logging.info(f"Switched to pattern: {BINGO_PATTERNS[state['current_pattern']]}")
+        state.pattern_index = (state.pattern_index + 1) % len(PATTERN_KEYS)
+        state.current_pattern = PATTERN_KEYS[state.pattern_index]
+        state.pattern_change_time = pygame.time.get_ticks() + 2000
+        logging.info(f"Switched to pattern: {BINGO_PATTERNS[state.current_pattern]}")
+
+
+def coalesce_key_events(events):
+    """
+    Collapses one frame's events into runs so each run is dispatched once.
+
+    Consecutive digit presses merge into a single string and consecutive
+    presses of the same key merge into a repeat count. Order is kept, so
+    typed numbers, Enter and confirmations still apply in sequence.
+
+    Args:
+        events (list): Events drained from the pygame queue.
+
+    Returns:
+        list: [event, count, digits] runs in arrival order.
+    """
+    runs = []
+    for event in events:
+        if event.type == pygame.KEYDOWN:
+            is_digit = event.unicode.isdecimal()
+            if runs and runs[-1][0].type == pygame.KEYDOWN:
+                last_run = runs[-1]
+                if is_digit and last_run[2]:
+                    last_run[2] += event.unicode
+                    continue
+                if event.key == last_run[0].key:
+                    last_run[1] += 1
+                    continue
+            runs.append([event, 1, event.unicode if is_digit else ""])
+        elif event.type == pygame.QUIT:
+            runs.append([event, 1, ""])
+    return runs
 
 
 def handle_input(state):
     """Handles user input differently in manual and auto modes."""
-    if state["is_announcing"] or state["is_reviewing"]:
+    if state.is_announcing or state.is_reviewing:
         return
 
-    for event in pygame.event.get():
+    for event, count, digits in coalesce_key_events(pygame.event.get()):
         if event.type == pygame.QUIT:
-            state["running"] = False
+            state.running = False
             logging.info("Quit event received, exiting game.")
 
         elif event.type == pygame.KEYDOWN:
@@ -1091,8 +1477,8 @@ def handle_input(state):
             process_pattern_change(state, event)
 
             # Delegate to mode-specific input handlers
-            if state["is_manual_mode"]:
-                handle_manual_mode_input(state, event)
+            if state.is_manual_mode:
+                handle_manual_mode_input(state, event, count, digits)
             else:
                 handle_auto_mode_input(state, event)
 
@@ -1102,23 +1488,19 @@ def get_confirmation_message(state):
     Returns the appropriate confirmation message based on the current game state.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
 
     Returns:
         str: The confirmation message to display, or None if no message.
     """
-    if state["awaiting_confirmation"]:
-        return "Reset the board? (Y/N)"
-    elif state["awaiting_restore_confirmation"]:
-        return "Restore the last board? (Y/N)"
-    elif state["awaiting_undo_confirmation"]:
-        return "Undo last ball? (Y/N)"
-    elif state["message_timeout"] > time.time():
+    if state.confirmation:
+        return CONFIRM_MESSAGES[state.confirmation]
+    elif state.message_timeout > pygame.time.get_ticks():
         return ALL_BALLS_DRAWN_MSG
     return None
 
 
-def get_board_position(ball_label):
+def compute_board_position(ball_label):
     """
     Calculates the final (x, y) position for a ball on the board.
 
@@ -1127,13 +1509,7 @@ def get_board_position(ball_label):
 
     Returns:
         tuple: The (x, y) position on the board.
-
-    Raises:
-        ValueError: If the ball_label is invalid.
     """
-    if not ball_label or len(ball_label) < 2 or ball_label[0] not in "BINGO" or not ball_label[1:].isdigit():
-        raise ValueError(f"Invalid ball label: {ball_label}")
-
     left_margin = WIDTH // 25
     right_margin = WIDTH // 50
     available_width = WIDTH - left_margin - right_margin
@@ -1150,13 +1526,36 @@ def get_board_position(ball_label):
     return board_x, board_y
 
 
+# Board position of every ball, computed once for the fixed screen size
+BOARD_POSITIONS = {ball_label: compute_board_position(ball_label) for ball_label in BALL_LABEL_BY_NUMBER[1:]}
+
+
+def get_board_position(ball_label):
+    """
+    Looks up the final (x, y) position for a ball on the board.
+
+    Args:
+        ball_label (str): The label of the ball (e.g., "B10").
+
+    Returns:
+        tuple: The (x, y) position on the board.
+
+    Raises:
+        ValueError: If the ball_label is invalid.
+    """
+    try:
+        return BOARD_POSITIONS[ball_label]
+    except KeyError:
+        raise ValueError(f"Invalid ball label: {ball_label}") from None
+
+
 ### Render Function ###
 def render(state, background_color, font_color, highlight_color):
     """
     Renders the game board, messages, and confirmation prompts.
 
     Args:
-        state (dict): The current game state.
+        state (GameState): The current game state.
         background_color (tuple): The background color (R, G, B).
         font_color (tuple): The font color for text (R, G, B).
         highlight_color (tuple): The color for highlighted balls (R, G, B).
@@ -1164,9 +1563,9 @@ def render(state, background_color, font_color, highlight_color):
     Returns:
         None
     """
-    if state["is_announcing"]:
+    if state.is_announcing:
         handle_announcement(state)
-    elif state["is_reviewing"]:
+    elif state.is_reviewing:
         handle_review(state)
     else:
         handle_idle_render(state, background_color, font_color, highlight_color)
@@ -1174,37 +1573,54 @@ def render(state, background_color, font_color, highlight_color):
 
 def handle_announcement(state):
     """Handles transitioning from announcement to review mode."""
-    state["is_announcing"] = False
-    state["is_reviewing"] = True
-    state["review_start_time"] = time.time()
+    state.is_announcing = False
+    state.is_reviewing = True
+    state.review_start_time = pygame.time.get_ticks()
+    state.review_presented = False
 
 
 def handle_review(state):
     """Handles rendering the review mode and transitioning to idle."""
     display_ball_review(state)
-    if time.time() - state["review_start_time"] >= REVIEW_DURATION:
-        if state["current_ball"]:
+    if pygame.time.get_ticks() - state.review_start_time >= REVIEW_DURATION_MS:
+        if state.current_ball:
             animate_ball_transition(
                 start_pos=(WIDTH // 2, HEIGHT // 2),
-                end_pos=get_board_position(state["current_ball"]),
+                end_pos=get_board_position(state.current_ball),
                 start_radius=REVIEW_CIRCLE_RADIUS,
                 end_radius=CIRCLE_RADIUS,
-                start_font_size=200,
-                end_font_size=NUMBER_FONT_SIZE - 25,
-                ball_label=state["current_ball"],
+                start_font_size=ANIMATION_START_FONT_SIZE,
+                end_font_size=ANIMATION_END_FONT_SIZE,
+                ball_label=state.current_ball,
                 duration=1.5,
             )
-        state["is_reviewing"] = False
+        state.is_reviewing = False
+        state.presented_board = None  # Screen no longer shows the board
 
 
 def handle_idle_render(state, background_color, font_color, highlight_color):
     """Handles rendering the idle board and confirmation messages."""
-    clear_screen()
-    display_bingo_board(state, font_color, highlight_color)
     confirmation_message = get_confirmation_message(state)
-    if confirmation_message:
-        display_confirmation(confirmation_message)
-    pygame.display.flip()
+    state.confirmation_message = confirmation_message
+
+    # Any change to the drawn balls, pattern or message (or returning from
+    # the review screen) means the board has to be recomposed.
+    board = (state.drawn_mask, state.current_pattern, confirmation_message)
+    board_changed = board != state.presented_board
+    if not board_changed and not state.particles["count"]:
+        return  # Nothing changed and nothing is animating; the screen is current
+
+    particle_rect = display_bingo_board(state, font_color, highlight_color)
+
+    # Present the whole screen only when the board itself changed;
+    # otherwise just the areas the particles covered last frame and this one.
+    dirty_rects = [particle_rect] if particle_rect else []
+    if board_changed:
+        pygame.display.flip()
+        state.presented_board = board
+    else:
+        pygame.display.update(state.particle_rects + dirty_rects)
+    state.particle_rects = dirty_rects
 
 
 def load_and_scale_images():
@@ -1212,7 +1628,8 @@ def load_and_scale_images():
     images = {}
     for key, filename in pattern_filenames.items():
         try:
-            img = pygame.image.load(os.path.join(script_dir, filename))
+            # Convert to the display format once so per-frame blits skip pixel conversion
+            img = pygame.image.load(os.path.join(script_dir, filename)).convert_alpha()
             images[key] = pygame.transform.scale(img, (450, 500))  # Resize to fit the UI
         except FileNotFoundError:
             logging.warning(f"Image file '{filename}' for pattern '{key}' not found. Falling back to text.")
@@ -1223,35 +1640,86 @@ def load_and_scale_images():
     return images
 
 
+class GameState:
+    """
+    Mutable game state shared by the input, logic and render functions.
+
+    Attributes are fixed by __slots__, so a misspelt name raises
+    AttributeError instead of silently adding a new key.
+
+    Args:
+        pattern_images (dict): Scaled pattern images keyed by pattern name.
+    """
+    __slots__ = (
+        "remaining_set",
+        "drawn_balls",
+        "drawn_mask",
+        "last_game",
+        "confirmation",
+        "message_timeout",
+        "running",
+        "is_announcing",
+        "is_reviewing",
+        "announcement_time",
+        "review_start_time",
+        "pattern_change_time",
+        "current_ball",
+        "review_spoken",
+        "review_presented",
+        "is_manual_mode",
+        "typed_number",
+        "current_pattern",
+        "pattern_index",
+        "pattern_images",
+        "board_bg",
+        "board_bg_pattern",
+        "presented_board",
+        "confirmation_message",
+        "particles",
+        "particle_rects",
+    )
+
+    def __init__(self, pattern_images):
+        self.remaining_set = initialize_balls()  # Balls not yet drawn
+        self.drawn_balls = []
+        self.drawn_mask = 0  # Bit n set when ball number n is drawn
+        self.last_game = []
+        self.confirmation = Confirm.NONE  # Prompt awaiting a Y/N answer
+        self.message_timeout = 0  # pygame.time.get_ticks() deadline, in ms
+        self.running = True
+        self.is_announcing = False
+        self.is_reviewing = False
+        self.announcement_time = 0  # Timestamps below are pygame ticks (ms)
+        self.review_start_time = 0
+        self.pattern_change_time = 0
+        self.current_ball = None
+        self.review_spoken = False  # Newest ball already spoken on the review screen
+        self.review_presented = False  # Review screen already flipped to the display
+        self.is_manual_mode = False
+        self.typed_number = ""  # Digits entered in manual mode
+        self.current_pattern = PATTERN_KEYS[0]
+        self.pattern_index = 0  # Index of current_pattern in PATTERN_KEYS
+        self.pattern_images = pattern_images
+        self.board_bg = None
+        self.board_bg_pattern = None
+        self.presented_board = None  # Board contents last presented with a full flip
+        self.confirmation_message = None
+        self.particles = create_particles()
+        self.particle_rects = []  # Particle areas presented last frame
+
+
 def initialize_state(pattern_images):
-    """Initialize the game state dictionary."""
-    return {
-        "balls": initialize_balls(),
-        "drawn_balls": [],
-        "last_game": [],
-        "awaiting_confirmation": False,
-        "awaiting_undo_confirmation": False,
-        "awaiting_restore_confirmation": False,
-        "message_timeout": 0,
-        "running": True,
-        "is_announcing": False,
-        "is_reviewing": False,
-        "announcement_time": 0,
-        "review_start_time": 0,
-        "current_ball": None,
-        "is_manual_mode": False,
-        "current_pattern": "REGULAR",
-        "pattern_images": pattern_images,
-    }
+    """Initialize the game state."""
+    return GameState(pattern_images)
 
 
 def run_game_loop(state):
     """Run the main game loop."""
     logging.info("Game started.")
-    while state["running"]:
+    while state.running:
+        handle_input(state)  # Before render so input shows up this frame
         render(state, BACKGROUND_COLOR, FONT_COLOR, HIGHLIGHT_COLOR)
-        handle_input(state)
-        pygame.display.flip()
+        _CLOCK.tick(TARGET_FPS)  # Throttle event pumping to the frame rate
     logging.info("Game exited.")
 
 
@@ -1268,6 +1736,8 @@ def main():
 
     # Initialize game state
     state = initialize_state(pattern_images)
+    build_board_background(state, FONT_COLOR)
+    build_cell_layout(FONT_COLOR)
 
     # Run the game loop
     run_game_loop(state)
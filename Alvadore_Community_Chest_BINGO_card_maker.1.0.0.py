@@ -1,76 +1,81 @@
-import random
 import os
+import sys
 
-def generate_bingo_card():
-    card = {}
-
-    # Define the number ranges for each column
-    ranges = {
-        'B': range(1, 16),
-        'I': range(16, 31),
-        'N': range(31, 46),
-        'G': range(46, 61),
-        'O': range(61, 76),
-    }
-
-    # Populate each column with random numbers within its range
-    for letter, number_range in ranges.items():
-        if letter == 'N':
-            # "N" column has a free space in the center (third row)
-            card[letter] = random.sample(number_range, 4)
-            card[letter].insert(2, "Free")  # Place "Free" in the third row (index 2)
-        else:
-            card[letter] = random.sample(number_range, 5)
-    
-    return card
-
-def save_to_txt(cards_output, filename):
+try:
+    import numpy as np
+except ImportError as e:
+    print(f"Required third-party module missing: {e}")  # Fallback to console output
+    sys.exit(1)  # Fail fast if critical modules are unavailable
+
+FREE_SPACE = -1  # Sentinel for the free space in the center of each card
+_LETTERS = "BINGO"
+_COLUMN_STARTS = np.arange(1, 76, 15)  # Lowest number in each column: B1, I16, N31, G46, O61
+
+def generate_bingo_cards(num_cards):
+    rng = np.random.default_rng()
+
+    # Populate every column of every card with 5 distinct random numbers within
+    # its range by taking the first 5 positions of a random ordering of the 15
+    # candidates; ranks[card, column, row]
+    ranks = rng.random((num_cards, len(_LETTERS), 15)).argsort(axis=2)[:, :, :5]
+    cards = (ranks + _COLUMN_STARTS[:, None]).transpose(0, 2, 1)  # cards[card, row, column]
+
+    # "N" column has a free space in the center (third row)
+    cards[:, 2, 2] = FREE_SPACE
+    return cards
+
+def format_cards(cards_output):
+    # Each card's lines, followed by a blank line between cards
+    return "".join("\n".join(card) + "\n\n" for card in cards_output)
+
+def save_to_txt(cards_text, filename):
     with open(filename, 'w', encoding='utf-8') as file:
-        for card in cards_output:
-            for line in card:
-                file.write(line + "\n")
-            file.write("\n")  # Blank line between cards
+        file.write(cards_text)  # One write for the whole batch
+
+def next_file_number(filename_base):
+    # One directory listing instead of an exists() probe per saved file
+    prefix = f"{filename_base}_"
+    numbers = [0]
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if not (entry.name.startswith(prefix) and entry.name.endswith(".txt")):
+                continue
+            number = entry.name[len(prefix):-len(".txt")]
+            if number.isdecimal():  # isdigit would pass characters int() rejects, like '²'
+                numbers.append(int(number))
+    return max(numbers) + 1
 
 def generate_and_save_bingo_cards():
     title = "Alvadore Community Chest Bingo Card"
 
     cards_output = []
-    for _ in range(6):  # Generate 6 unique cards
-        card = generate_bingo_card()
-
+    for card in generate_bingo_cards(6):  # Generate 6 unique cards
         # Create a list for the card's text representation
         card_output = []
         card_output.append(title)
-        card_output.append("B\tI\tN\tG\tO")
+        card_output.append("\t".join(_LETTERS))
         card_output.append("--------------------------")
 
         # Format each row of numbers
-        for i in range(5):
+        for card_row in card.tolist():
             row = []
-            for letter in "BINGO":
-                cell = str(card[letter][i]).ljust(4)  # Ensure consistent spacing
+            for number in card_row:
+                cell = ("Free" if number == FREE_SPACE else str(number)).ljust(4)  # Ensure consistent spacing
                 row.append(cell)
             card_output.append("\t".join(row))
 
         cards_output.append(card_output)
 
     # Print to console
-    for card_output in cards_output:
-        for line in card_output:
-            print(line)
-        print()  # Blank line between cards
+    cards_text = format_cards(cards_output)
+    print(cards_text, end="")
 
     # Save to text file with an incremented filename to avoid overwriting
     filename_base = "Alvadore_Community_Chest_Bingo_Cards"
-    file_number = 1
-    txt_filename = f"{filename_base}_{file_number}.txt"
-
-    while os.path.exists(txt_filename):
-        file_number += 1
-        txt_filename = f"{filename_base}_{file_number}.txt"
+    txt_filename = f"{filename_base}_{next_file_number(filename_base)}.txt"
 
     # Save file
-    save_to_txt(cards_output, txt_filename)
+    save_to_txt(cards_text, txt_filename)
 
     print(f"\nBingo cards saved as '{txt_filename}'")
 